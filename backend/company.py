@@ -1,7 +1,51 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import cachetools
 import pandas as pd
 import yfinance as yf
 
 
+# Process-wide cache of raw Yahoo Finance data, keyed by ticker (10 min TTL).
+_FINANCIALS_CACHE = cachetools.TTLCache(maxsize=1024, ttl=600)
+
+
+@cachetools.cached(
+    _FINANCIALS_CACHE,
+    key=lambda ticker, _obj=None: cachetools.keys.hashkey(ticker),
+    lock=threading.Lock(),
+)
+def _fetch_financials(
+    ticker: str, _obj: yf.Ticker | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame, float, int]:
+    """
+    Retrieve the raw financial data for a ticker from Yahoo Finance.
+
+    Results are memoized per ticker for a few minutes so that repeated
+    evaluations of the same symbol skip the network entirely. Exceptions
+    propagate to the caller and are never stored in the cache.
+
+    Parameters:
+        ticker (str): The stock ticker symbol of the company.
+        _obj (yf.Ticker | None): Optional pre-built Ticker object (e.g. from
+            a yf.Tickers batch). Not part of the cache key.
+
+    Returns:
+        tuple: (balance_sheet, income_statement, current_price, shares_outstanding)
+    """
+    # No session is passed: yfinance already shares a single keep-alive
+    # curl_cffi session across all Ticker objects, and it rejects plain
+    # requests / requests_cache sessions.
+    if _obj is None:
+        _obj = yf.Ticker(ticker)
+    bs = _obj.balance_sheet.iloc[:, :4]
+    ist = _obj.income_stmt.iloc[:, :4]
+    current_price = _obj.history(period='1d')['Close'].iloc[0]
+    shares_outstanding = _obj.info['sharesOutstanding']
+    return bs, ist, current_price, shares_outstanding
+
+
+
 class Company:
     """
     Represents a publicly traded firm and exposes the financial statement
@@ -14,12 +58,15 @@ class Company:
                 2 = Private / non-manufacturing firm (Z'-Score).
                 3 = Emerging market firm (Z''-Score).
 
+            financials (tuple | None): Optional data already retrieved with
+                bulk_fetch. When omitted, the data is fetched for the ticker.
+
     Raises:
         ValueError: If industry_type is not 1, 2, or 3.
         RuntimeError: If financial data cannot be retrieved for the ticker.
     """
 
-    def __init__(self, ticker: str, industry_type: int) -> None:
+    def __init__(self, ticker: str, industry_type: int, financials: tuple | None = None) -> None:
         if industry_type not in (1, 2, 3):
             raise ValueError("industry_type must be 1, 2, or 3.")
 
@@ -27,55 +74,121 @@ class Company:
         self.industry_type = industry_type
 
         try:
-            _obj = yf.Ticker(ticker)
-            self._bs = pd.DataFrame(_obj.balance_sheet.iloc[:, :4])
-            self._ist = pd.DataFrame(_obj.income_stmt.iloc[:, :4])
-            self._current_price = _obj.history(period='1d')['Close'].iloc[0]
-            self._shares_outstanding = _obj.info['sharesOutstanding']
+            if financials is None:
+                financials = _fetch_financials(ticker)
+            (
+                self._bs,
+                self._ist,
+                self._current_price,
+                self._shares_outstanding,
+            ) = financials
+
+            # Latest-period line items as plain dicts; each accessor reads
+            # only the item it needs, so rows unused by the company's model
+            # may be missing
+            self._bs_latest = self._bs.iloc[:, 0].to_dict()
+            self._ist_latest = self._ist.iloc[:, 0].to_dict()
         except Exception as exc:
             raise RuntimeError(
                 f"Failed to retrieve financial data for ticker '{ticker}': {exc}"
             ) from exc
 
+    def _line_item(self, statement: dict, name: str) -> float:
+        """
+        Return a latest-period line item as a float.
+
+        Parameters:
+            statement (dict): Latest-period balance sheet or income statement.
+            name (str): The line item to read.
+
+        Returns:
+            float: The value of the line item.
+
+        Raises:
+            RuntimeError: If the line item is not reported for the ticker.
+        """
+        try:
+            return float(statement[name])
+        except Exception as exc:
+            raise RuntimeError(
+                f"Failed to retrieve financial data for ticker '{self.ticker}': {exc}"
+            ) from exc
+
+    @classmethod
+    def bulk_fetch(cls, tickers: list[str]) -> dict[str, tuple | Exception]:
+        """
+        Retrieve the financial data for several tickers concurrently.
+
+        A single yf.Tickers object is built for all symbols and the per-ticker
+        statement downloads are fanned out over a thread pool. Results go
+        through the same TTL cache as single-ticker fetches.
+
+        Parameters:
+            tickers (list[str]): The stock ticker symbols to fetch.
+
+        Returns:
+            dict[str, tuple | Exception]: The financial data tuple for each
+            ticker, or the exception raised while fetching it.
+        """
+        symbols = list(dict.fromkeys(tickers))
+        if not symbols:
+            return {}
+
+        batch = yf.Tickers(" ".join(symbols))
+
+        def _fetch(symbol: str) -> tuple | Exception:
+            try:
+                return _fetch_financials(symbol, batch.tickers.get(symbol))
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=min(32, len(symbols))) as executor:
+            return dict(zip(symbols, executor.map(_fetch, symbols)))
+
     # Balance Sheet items
 
     def total_assets(self) -> float:
         """Return the total assets of the company."""
-        return self._bs.loc['Total Assets'].iloc[0]
+        return self._line_item(self._bs_latest, 'Total Assets')
 
     def working_capital(self) -> float:
         """Return the working capital of the company."""
-        return self._bs.loc['Working Capital'].iloc[0]
+        return self._line_item(self._bs_latest, 'Working Capital')
 
     def retained_earnings(self) -> float:
         """Return the retained earnings of the company."""
-        return self._bs.loc['Retained Earnings'].iloc[0]
+        return self._line_item(self._bs_latest, 'Retained Earnings')
 
     def total_liabilities(self) -> float:
         """Return the total liabilities of the company."""
-        return self._bs.loc['Total Liabilities Net Minority Interest'].iloc[0]
+        return self._line_item(self._bs_latest, 'Total Liabilities Net Minority Interest')
     
     def current_liabilities(self) -> float:
         """Return the current liabilities of the company."""
-        return self._bs.loc['Current Liabilities'].iloc[0]
+        return self._line_item(self._bs_latest, 'Current Liabilities')
 
-    def book_equity(self):
+    def book_equity(self) -> float:
         """Return the book equity of the company"""
-        return self._bs.loc['Stockholders Equity'].iloc[0]
+        return self._line_item(self._bs_latest, 'Stockholders Equity')
 
     def market_equity(self) -> float:
         """Return the market equity of the company."""
-        return self._current_price * self._shares_outstanding
+        try:
+            return float(self._current_price * self._shares_outstanding)
+        except Exception as exc:
+            raise RuntimeError(
+                f"Failed to retrieve financial data for ticker '{self.ticker}': {exc}"
+            ) from exc
 
     # Income Statement items
 
     def ebit(self) -> float:
         """Return the EBIT (Earnings Before Interest and Taxes) of the company."""
-        return self._ist.loc['EBIT'].iloc[0]
+        return self._line_item(self._ist_latest, 'EBIT')
 
     def total_revenue(self) -> float:
         """Return the total revenue of the company."""
-        return self._ist.loc['Total Revenue'].iloc[0]
+        return self._line_item(self._ist_latest, 'Total Revenue')
     
     # Altman ratios
 
@@ -1,11 +1,25 @@
+import threading
+
+import cachetools
+import numpy as np
+
 from company import Company
-from models import AltmanValuationModel, MertonModel, combined_decision
-from schemas import ZScoreRequest, ZScoreResponse, RatiosDetail, MertonDetail
+from models import AltmanValuationModel, MertonModel, altman_batch, combined_decision
+from schemas import (
+    ZScoreRequest, ZScoreResponse, RatiosDetail, MertonDetail,
+    ErrorResponse, BatchResponse,
+)
+
+# Evaluations keyed by the (frozen, hashable) request; 10 min TTL.
+_EVALUATION_CACHE = cachetools.TTLCache(maxsize=256, ttl=600)
 
+
+@cachetools.cached(_EVALUATION_CACHE, lock=threading.Lock())
 def evaluate_company(request: ZScoreRequest) -> ZScoreResponse:
     """
     Full pipeline to evaluate a company's financial health using the Altman Z-Score
-    and Merton models, then produce a combined credit decision.
+    and Merton models, then produce a combined credit decision. Results are
+    cached per request for a few minutes.
 
     Parameters:
         request (ZScoreRequest): Validated request containing ticker and industry_type.
@@ -21,17 +35,104 @@ def evaluate_company(request: ZScoreRequest) -> ZScoreResponse:
         ticker=request.ticker,
         industry_type=request.industry_type
     )
-    altman_model = AltmanValuationModel.for_industry_type(request.industry_type)
-    altman = altman_model.evaluate(company)
+    return _evaluate(company)
+
+
+def evaluate_companies(requests: list[ZScoreRequest]) -> BatchResponse:
+    """
+    Evaluate several companies at once, fetching their financial data
+    concurrently and scoring all Altman Z-Scores in one altman_batch call
+    before running the Merton model on each.
+
+    Parameters:
+        requests (list[ZScoreRequest]): Validated requests, one per company.
+
+    Returns:
+        BatchResponse: One result per request, in the same order. Companies
+        that could not be evaluated are reported as ErrorResponse entries.
+    """
+    financials = Company.bulk_fetch([req.ticker for req in requests])
+
+    results: list[ZScoreResponse | ErrorResponse | None] = [None] * len(requests)
+    rows = []  # (position, company, model, ratios) of the companies to score
+    for i, req in enumerate(requests):
+        data = financials[req.ticker]
+        if isinstance(data, Exception):
+            results[i] = ErrorResponse(
+                ticker=req.ticker,
+                error=f"Failed to retrieve financial data for ticker '{req.ticker}': {data}",
+            )
+            continue
+        try:
+            company = Company(
+                ticker=req.ticker,
+                industry_type=req.industry_type,
+                financials=data,
+            )
+            model = AltmanValuationModel.for_industry_type(company.industry_type)
+            rows.append((i, company, model, model.ratios(company)))
+        except Exception as exc:
+            results[i] = ErrorResponse(ticker=req.ticker, error=str(exc))
+
+    if rows:
+        xs = np.array([list(ratios.values()) for _, _, _, ratios in rows], dtype=np.float64)
+        z_scores, classifications = altman_batch(
+            *xs.T, [company.industry_type for _, company, _, _ in rows]
+        )
+        for (i, company, model, ratios), z_score, classification in zip(
+            rows, z_scores.tolist(), classifications
+        ):
+            altman = {
+                "z_score": z_score,
+                "classification": classification,
+                "model_name": type(model).__name__,
+                "ratios": ratios,
+            }
+            try:
+                results[i] = _respond(company, altman)
+            except Exception as exc:
+                results[i] = ErrorResponse(ticker=company.ticker, error=str(exc))
+
+    return BatchResponse(results=results)
+
+
+def _evaluate(company: Company) -> ZScoreResponse:
+    """
+    Run the Altman and Merton models on an already-loaded company and
+    assemble the combined response.
+
+    Parameters:
+        company (Company): The company to evaluate.
+
+    Returns:
+        ZScoreResponse: Structured response including Altman, Merton, and combined decision.
+    """
+    altman_model = AltmanValuationModel.for_industry_type(company.industry_type)
+    return _respond(company, altman_model.evaluate(company))
+
+
+def _respond(company: Company, altman: dict) -> ZScoreResponse:
+    """
+    Run the Merton model on a company with a finished Altman evaluation and
+    assemble the combined response.
+
+    Parameters:
+        company (Company): The company to evaluate.
+        altman (dict): Keys — z_score, classification, model_name, ratios.
+
+    Returns:
+        ZScoreResponse: Structured response including Altman, Merton, and combined decision.
+    """
     merton = MertonModel(company).evaluate()
     decision = combined_decision(altman["classification"], merton["classification"])
 
-    return ZScoreResponse(
-        ticker=request.ticker,
+    # Every field is produced internally, so skip pydantic re-validation
+    return ZScoreResponse.model_construct(
+        ticker=company.ticker,
         model_name=altman["model_name"],
         z_score=altman["z_score"],
         classification=altman["classification"],
-        ratios=RatiosDetail(**altman["ratios"]),
-        merton=MertonDetail(**merton),
+        ratios=RatiosDetail.model_construct(**altman["ratios"]),
+        merton=MertonDetail.model_construct(**merton),
         combined_decision=decision,
-    )
\ No newline at end of file
+    )
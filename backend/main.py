@@ -1,20 +1,43 @@
-from fastapi import FastAPI, HTTPException
+import os
+from typing import Annotated
+
+from fastapi import Body, FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
-from schemas import ZScoreRequest, ZScoreResponse
-from evaluation import evaluate_company
+from schemas import ZScoreRequest, ZScoreResponse, BatchResponse
+from evaluation import evaluate_company, evaluate_companies
 
+# No default_response_class: with a response_model on each endpoint FastAPI
+# serializes straight to JSON bytes through pydantic-core, which is faster
+# than a custom class such as ORJSONResponse (deprecated in FastAPI 0.13x).
 app = FastAPI(
     title="Altman Z-Score API",
     description="API to evaluate the financial health of companies using the Altman Z-Score model.",
     version="1.0.0",
 )
 
+# Matches the lifetime of the backend's financial data and evaluation caches
+CACHE_CONTROL = "public, max-age=600"
+
+# Upper bound on companies per /evaluate_batch call; each one is a Yahoo fetch
+MAX_BATCH_SIZE = 50
+
+# Comma-separated list of browser origins allowed to call the API
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get(
+        "ALLOWED_ORIGINS", "http://localhost:8501,http://127.0.0.1:8501"
+    ).split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
 )
 
 @app.post(
@@ -27,12 +50,17 @@ app.add_middleware(
         "the underlying ratios and risk classification."
     ),
 )
-def evaluate(request: ZScoreRequest) -> ZScoreResponse:
+async def evaluate(request: ZScoreRequest, response: Response) -> ZScoreResponse:
     """
     API endpoint to evaluate a company's financial health using the Altman Z-Score model.
 
+    Successful responses carry a Cache-Control header. No ETag is sent: the
+    body changes intraday with the share price, and conditional requests on
+    a POST could only be answered with 412, never 304.
+
     Parameters:
         request (ZScoreRequest): Validated request containing ticker and industry_type.
+        response (Response): Outgoing response, used to set caching headers.
 
     Returns:
         ZScoreResponse: Structured response containing the evaluation results.
@@ -41,7 +69,7 @@ def evaluate(request: ZScoreRequest) -> ZScoreResponse:
         HTTPException: If there is an error during data retrieval or computation.
     """
     try:
-        return evaluate_company(request)
+        result = await run_in_threadpool(evaluate_company, request)
     except RuntimeError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
     except ValueError as exc:
@@ -49,6 +77,42 @@ def evaluate(request: ZScoreRequest) -> ZScoreResponse:
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Unexpected error: '{str(exc)}': {exc}")
 
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return result
+
+@app.post(
+    "/evaluate_batch",
+    response_model=BatchResponse,
+    summary="Evaluate several companies",
+    description=(
+        "Accepts a list of tickers and industry types, retrieves their "
+        "financial data from Yahoo Finance concurrently, and returns one "
+        "result per company. Companies that cannot be evaluated are "
+        "reported with an error message instead of failing the whole batch. "
+        f"At most {MAX_BATCH_SIZE} companies can be sent per request."
+    ),
+)
+async def evaluate_batch(
+    requests: Annotated[list[ZScoreRequest], Body(max_length=MAX_BATCH_SIZE)],
+) -> BatchResponse:
+    """
+    API endpoint to evaluate several companies in a single request.
+
+    Parameters:
+        requests (list[ZScoreRequest]): Validated requests, one per company
+            (at most MAX_BATCH_SIZE; larger lists are rejected with 422).
+
+    Returns:
+        BatchResponse: One result or error per requested company.
+
+    Raises:
+        HTTPException: If there is an unexpected error while processing the batch.
+    """
+    try:
+        return await run_in_threadpool(evaluate_companies, requests)
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Unexpected error: '{str(exc)}': {exc}")
+
 @app.get("/health", summary="Health check")
 def health_check():
     """
@@ -57,4 +121,4 @@ def health_check():
     Returns:
         dict: A message indicating that the API is healthy.
     """
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
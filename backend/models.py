@@ -1,31 +1,73 @@
 import abc
+import bisect
+import math
 import numpy as np
-from scipy.stats import norm
 from company import Company
 
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; plain NumPy is used instead
+    ne = None
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; the kernels then run as plain Python
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Zone labels indexed by classification code (0, 1, 2)
+_ZONE_LABELS = ("Distress Zone", "Grey Zone", "Safe Zone")
+
 class AltmanValuationModel(abc.ABC):
     """
     Abstract base class for valuation models.
 
     Each subclass declares its own SAFE_THRESHOLD and DISTRESS_THRESHOLD
-    so that classification boundaries reflect the correct model variant.
+    so that classification boundaries reflect the correct model variant,
+    along with the COEFFS applied to the leading ratios of (X1, X2, X3,
+    X4, X5) and the name of the Company method used for X4 (market or book
+    equity variant). A model with fewer coefficients ignores the trailing
+    ratios entirely, so a missing value there cannot reach the score.
     """
     SAFE_THRESHOLD: float
     DISTRESS_THRESHOLD: float
+    COEFFS: np.ndarray
+    _X4_METHOD: str
+    _THRESH: tuple[float, float]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Sorted boundaries for bisect_right: Z >= DISTRESS is Grey, and
+        # Z > SAFE (i.e. Z >= the next float above SAFE) is Safe.
+        cls._THRESH = (
+            cls.DISTRESS_THRESHOLD,
+            math.nextafter(cls.SAFE_THRESHOLD, math.inf),
+        )
 
     def classify(self, z_score: float) -> str:
-        if z_score > self.SAFE_THRESHOLD:
-            return "Safe Zone"
-        elif z_score >= self.DISTRESS_THRESHOLD:
-            return "Grey Zone"
-        else:
+        """
+        Classify a Z-Score into the Safe, Grey or Distress Zone.
+
+        Parameters:
+            z_score (float): The Z-Score to classify.
+        Returns:
+            str: The zone label.
+        """
+        if math.isnan(z_score):
             return "Distress Zone"
+        return _ZONE_LABELS[bisect.bisect_right(self._THRESH, z_score)]
 
     @classmethod
     def for_industry_type(cls, industry_type: int) -> 'AltmanValuationModel':
         """
-        Factory method to create an instance of the appropriate valuation model
-        based on the industry type.
+        Factory method to return the shared instance of the appropriate
+        valuation model based on the industry type.
 
         Parameters:
             industry_type (int): The industry type of the company.
@@ -36,17 +78,12 @@ class AltmanValuationModel(abc.ABC):
             AltmanValuationModel: An instance of the appropriate valuation
             model for the given industry type.
         """
-        model_map: dict[int, AltmanValuationModel] = {
-            1: AltmanClassic(),
-            2: AltmanPrime(),
-            3: AltmanEmergingMarkets()
-        }
-
-        if industry_type not in model_map:
+        try:
+            return _MODEL_MAP[industry_type]
+        except KeyError:
             raise ValueError(
                 f"Invalid industry type: {industry_type}. Must be 1, 2, or 3."
-            )
-        return model_map[industry_type]
+            ) from None
 
 
     def evaluate(self, company: Company) -> dict:
@@ -61,122 +98,225 @@ class AltmanValuationModel(abc.ABC):
         """
         z_score, ratios = self.compute(company)
         return {
-            "z_score": round(z_score, 4),
+            "z_score": z_score,
             "classification": self.classify(z_score),
             "model_name": type(self).__name__,
             "ratios": ratios,
         }
 
-    @abc.abstractmethod
-    def compute(self, company: Company) -> tuple[float, dict]:
+    def ratios(self, company: Company) -> dict:
         """
-        Compute the Z-Score and return the score alongside a dict of ratios.
+        Return the company's five Altman ratios, using the X4 variant of this
+        model. Ratios the model does not score are NaN when their line items
+        are missing.
 
         Parameters:
-            company (Company): The company for which to compute the valuation.
+            company (Company): The company whose ratios to compute.
         Returns:
-            tuple[float, dict]: (z_score, ratios_dict)
+            dict: Keys — x1, x2, x3, x4, x5.
         """
+        ratio_methods = (
+            company.x1,
+            company.x2,
+            company.x3,
+            getattr(company, self._X4_METHOD),
+            company.x5,
+        )
+        n_terms = len(self.COEFFS)
+        values = (
+            [method() for method in ratio_methods[:n_terms]]
+            + [_reported_ratio(method) for method in ratio_methods[n_terms:]]
+        )
+        return dict(zip(("x1", "x2", "x3", "x4", "x5"), values))
 
-
-class AltmanClassic(AltmanValuationModel):
-    SAFE_THRESHOLD = 2.99
-    DISTRESS_THRESHOLD = 1.81
     def compute(self, company: Company) -> tuple[float, dict]:
         """
-        Compute the Altman Z-score for the given company.
+        Compute the Z-Score as the dot product of the model coefficients
+        and the matching leading ratios, and return the score alongside a
+        dict of all five ratios.
 
         Parameters:
-            company (Company): The company for which to compute the Z-score.
+            company (Company): The company for which to compute the valuation.
         Returns:
             tuple[float, dict]: (z_score, ratios_dict)
         """
-        x1 = company.x1()
-        x2 = company.x2()
-        x3 = company.x3()
-        x4 = company.x4()
-        x5 = company.x5()
-        z_score = 1.2*x1 + 1.4*x2 + 3.3*x3 + 0.6*x4 + 1.0*x5
-        ratios = {
-            "x1": round(x1, 6),
-            "x2": round(x2, 6),
-            "x3": round(x3, 6),
-            "x4": round(x4, 6),
-            "x5": round(x5, 6),
-        }
+        ratios = self.ratios(company)
+        xs = np.fromiter(ratios.values(), dtype=np.float64, count=len(ratios))
+        z_score = float(self.COEFFS @ xs[:len(self.COEFFS)])
         return z_score, ratios
 
 
+def _reported_ratio(method) -> float:
+    """Return a ratio that is reported but not scored, or NaN if unavailable."""
+    try:
+        return method()
+    except RuntimeError:
+        return math.nan
+
+
+class AltmanClassic(AltmanValuationModel):
+    """Classic Altman Z-Score (1968) for public manufacturing firms."""
+    SAFE_THRESHOLD = 2.99
+    DISTRESS_THRESHOLD = 1.81
+    COEFFS = np.array([1.2, 1.4, 3.3, 0.6, 1.0])
+    _X4_METHOD = "x4"
+
+
 class AltmanPrime(AltmanValuationModel):
+    """Altman Z'-Score (2000) for private or non-manufacturing firms."""
     SAFE_THRESHOLD = 2.6
     DISTRESS_THRESHOLD = 1.1
-    def compute(self, company: Company) -> tuple[float, dict]:
-        """
-        Compute the Altman Z-Score 2000 for the given company.
-
-        Parameters:
-            company (Company): The company for which to compute the Z-score.
-        Returns:
-            tuple[float, dict]: (z_score, ratios_dict)
-        """
-        x1 = company.x1()
-        x2 = company.x2()
-        x3 = company.x3()
-        x4 = company.x4_mod()
-        x5 = company.x5()
-        z_score = 0.717*x1 + 0.847*x2 + 3.107*x3 + 0.420*x4 + 0.998*x5
-        ratios = {
-            "x1": round(x1, 6),
-            "x2": round(x2, 6),
-            "x3": round(x3, 6),
-            "x4": round(x4, 6),
-            "x5": round(x5, 6),
-        }
-        return z_score, ratios
+    COEFFS = np.array([0.717, 0.847, 3.107, 0.420, 0.998])
+    _X4_METHOD = "x4_mod"
 
 
 class AltmanEmergingMarkets(AltmanValuationModel):
+    """Altman Z''-Score (Zeta-Score) for emerging market firms."""
     SAFE_THRESHOLD = 2.6
     DISTRESS_THRESHOLD = 1.1
-    def compute(self, company: Company) -> tuple[float, dict]:
-        """
-        Compute the Altman Zeta-Score for the given company.
+    COEFFS = np.array([6.56, 3.26, 6.72, 1.05])
+    _X4_METHOD = "x4_mod"
 
-        Parameters:
-            company (Company): The company for which to compute the Z-score.
-        Returns:
-            tuple[float, dict]: (z_score, ratios_dict)
-        """
-        x1 = company.x1()
-        x2 = company.x2()
-        x3 = company.x3()
-        x4 = company.x4_mod()
-        x5 = company.x5()
-        z_score = 6.56*x1 + 3.26*x2 + 6.72*x3 + 1.05*x4
-        ratios = {
-            "x1": round(x1, 6),
-            "x2": round(x2, 6),
-            "x3": round(x3, 6),
-            "x4": round(x4, 6),
-            "x5": round(x5, 6),
-        }
-        return z_score, ratios
+
+# Models are stateless, so one shared instance per industry type is enough.
+_MODEL_MAP: dict[int, AltmanValuationModel] = {
+    1: AltmanClassic(),
+    2: AltmanPrime(),
+    3: AltmanEmergingMarkets(),
+}
+
+
+# Per-model coefficient rows (zero-padded to five terms), term counts and
+# (distress, safe) thresholds, indexed by industry_type - 1, for the
+# vectorized batch evaluator.
+_COEFFS_TABLE = np.vstack([
+    np.pad(model.COEFFS, (0, 5 - len(model.COEFFS))) for model in _MODEL_MAP.values()
+])
+_N_TERMS_TABLE = np.array([len(model.COEFFS) for model in _MODEL_MAP.values()])
+_THRESHOLDS_TABLE = np.array(
+    [[model.DISTRESS_THRESHOLD, model.SAFE_THRESHOLD] for model in _MODEL_MAP.values()]
+)
+# Below this many rows numexpr's thread start-up outweighs the fused loop.
+_NUMEXPR_MIN_ROWS = 10_000
+
+
+@njit(parallel=True, cache=True)
+def _altman_batch(x1, x2, x3, x4, x5, model_id, coeffs, thresholds, out_z, out_cls):
+    """
+    Score and classify many companies in one pass over SoA ratio arrays.
+
+    Row i uses coeffs[model_id[i]] and thresholds[model_id[i]]. Results are
+    written to out_z (Z-Scores) and out_cls (0 = Distress, 1 = Grey,
+    2 = Safe Zone).
+    """
+    for i in prange(x1.shape[0]):
+        m = model_id[i]
+        z = (coeffs[m, 0] * x1[i] + coeffs[m, 1] * x2[i] + coeffs[m, 2] * x3[i]
+             + coeffs[m, 3] * x4[i] + coeffs[m, 4] * x5[i])
+        out_z[i] = z
+        if z > thresholds[m, 1]:
+            out_cls[i] = 2
+        elif z >= thresholds[m, 0]:
+            out_cls[i] = 1
+        else:
+            out_cls[i] = 0
+
+
+def _altman_batch_vectorized(x1, x2, x3, x4, x5, model_id) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array-expression equivalent of _altman_batch, used when numba is not
+    installed. Large inputs are evaluated with numexpr in one fused pass.
+    """
+    c1, c2, c3, c4, c5 = _COEFFS_TABLE[model_id].T
+    distress, safe = _THRESHOLDS_TABLE[model_id].T
+
+    if ne is not None and x1.shape[0] >= _NUMEXPR_MIN_ROWS:
+        z = ne.evaluate("c1*x1 + c2*x2 + c3*x3 + c4*x4 + c5*x5")
+    else:
+        z = c1*x1 + c2*x2 + c3*x3 + c4*x4 + c5*x5
+
+    cls = (z >= distress).astype(np.int8) + (z > safe)
+    return z, cls
+
+
+def altman_batch(x1, x2, x3, x4, x5, industry_types) -> tuple[np.ndarray, list[str]]:
+    """
+    Compute Altman Z-Scores and classifications for a whole portfolio at once.
+
+    Each argument is a 1-D array with one entry per company. The x4 entry
+    must already be the variant required by the company's model (market
+    equity for type 1, book equity for types 2 and 3).
+
+    Parameters:
+        x1, x2, x3, x4, x5 (array-like): The Altman ratios per company.
+        industry_types (array-like): The industry type (1, 2 or 3) per company.
+    Returns:
+        tuple[np.ndarray, list[str]]: (z_scores, classifications)
+    """
+    model_id = np.asarray(industry_types, dtype=np.int64) - 1
+    if np.any((model_id < 0) | (model_id >= len(_MODEL_MAP))):
+        raise ValueError("industry_type must be 1, 2, or 3.")
+
+    xs = [np.ascontiguousarray(x, dtype=np.float64) for x in (x1, x2, x3, x4, x5)]
+    # Ratios beyond a model's terms are zeroed so a NaN there cannot leak
+    # into the score through a zero-padded coefficient
+    n_terms = _N_TERMS_TABLE[model_id]
+    xs = [np.where(n_terms > k, x, 0.0) for k, x in enumerate(xs)]
+    if _HAS_NUMBA:
+        out_z = np.empty(model_id.shape[0], dtype=np.float64)
+        out_cls = np.empty(model_id.shape[0], dtype=np.int8)
+        _altman_batch(*xs, model_id, _COEFFS_TABLE, _THRESHOLDS_TABLE, out_z, out_cls)
+    else:
+        out_z, out_cls = _altman_batch_vectorized(*xs, model_id)
+    return out_z, [_ZONE_LABELS[c] for c in out_cls]
+
+
+# Credit decision for each (Altman, Merton) pair without a Distress Zone
+_DECISIONS = {
+    ("Safe Zone", "Safe Zone"): "Approved",
+    ("Grey Zone", "Safe Zone"): "Approved with Caution",
+    ("Safe Zone", "Grey Zone"): "Approved with Caution",
+    ("Grey Zone", "Grey Zone"): "Analysis Required",
+}
 
 
 def combined_decision(altman_cls: str, merton_cls: str) -> str:
-    if altman_cls == "Distress Zone" or merton_cls == "Distress Zone":
+    """
+    Combine the Altman and Merton classifications into a credit decision.
+
+    Parameters:
+        altman_cls (str): Altman Z-Score classification.
+        merton_cls (str): Merton model classification.
+    Returns:
+        str: Approved, Approved with Caution, Analysis Required or Dismissed.
+    """
+    if "Distress Zone" in (altman_cls, merton_cls):
         return "Dismissed"
-    elif altman_cls == "Safe Zone" and merton_cls == "Safe Zone":
-        return "Approved"
-    elif altman_cls == "Grey Zone" and merton_cls == "Safe Zone":
-        return "Approved with Caution"
-    elif altman_cls == "Safe Zone" and merton_cls == "Grey Zone":
-        return "Approved with Caution"
-    elif altman_cls == "Grey Zone" and merton_cls == "Grey Zone":
-        return "Analysis Required"
+    return _DECISIONS.get((altman_cls, merton_cls), "Analysis Required")
 
 
 
+@njit(cache=True)
+def _merton_kernel(v: float, d: float, sigma: float, r: float, t: float) -> tuple[float, float]:
+    """
+    Compute the Merton distance to default and default probability.
+
+    Parameters:
+        v (float): Firm asset value.
+        d (float): Debt face value (default point).
+        sigma (float): Asset volatility.
+        r (float): Risk-free rate.
+        t (float): Horizon in years.
+    Returns:
+        tuple[float, float]: (distance_to_default, default_probability)
+    """
+    drift = (r - 0.5 * sigma * sigma) * t
+    dd = (math.log(v / d) + drift) / (sigma * math.sqrt(t))
+    # 1 - N(dd) expressed through the complementary error function
+    prob = 0.5 * math.erfc(dd / math.sqrt(2.0))
+    return dd, prob
+
+
 class MertonModel:
     def __init__(self, company: Company):
         self.company = company
@@ -190,20 +330,29 @@ class MertonModel:
             return "Distress Zone"
 
     def evaluate(self) -> dict:
-        assets = self.company._bs.loc['Total Assets']
-        sigma = float(assets.pct_change().dropna().std())
+        assets = self.company._bs.loc['Total Assets'].to_numpy(dtype=np.float64)
+        # Missing periods are dropped so the returns span the reported ones.
+        # Unlike pct_change()'s forward fill, a gap contributes no zero
+        # return, and data with a single reported period has no volatility.
+        assets = assets[~np.isnan(assets)]
+        returns = assets[1:] / assets[:-1] - 1.0
+        # Fewer than two returns leave the sample std undefined (NaN)
+        sigma = float(np.std(returns, ddof=1)) if returns.size > 1 else math.nan
         v = self.company.total_assets()
         d = self.company.current_liabilities()
         r = 0.04
 
-        if sigma == 0 or v <= 0 or d <= 0:
-            return {"default_probability": float("nan"), "classification": "Grey Zone"}
+        if not math.isfinite(sigma) or sigma == 0 or v <= 0 or d <= 0:
+            return {
+                "distance_to_default": float("nan"),
+                "default_probability": float("nan"),
+                "classification": "Grey Zone",
+            }
         
-        t = 2  
-        dd = ((np.log(v / d) + (r - 0.5 * sigma**2)) * t) / (sigma*np.sqrt(t))
-        prob = float(1 - norm.cdf(dd))
+        t = 2.0
+        dd, prob = _merton_kernel(float(v), float(d), sigma, r, t)
         return {
-            "distance_to_default": dd,
+            "distance_to_default": float(dd),
             "default_probability": prob,
             "classification": self._classify_merton(prob),
         }
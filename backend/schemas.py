@@ -1,7 +1,9 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_serializer, field_validator
 
 class ZScoreRequest(BaseModel):
     """Schema for the request body of the Z-Score API endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     industry_type: int
 
@@ -29,6 +31,10 @@ class RatiosDetail(BaseModel):
     x4: float
     x5: float
 
+    @field_serializer('x1', 'x2', 'x3', 'x4', 'x5')
+    def serialize_ratio(self, value: float) -> float:
+        return round(value, 6)
+
 
 class MertonDetail(BaseModel):
     """Schema for Merton model results."""
@@ -47,8 +53,17 @@ class ZScoreResponse(BaseModel):
     merton: MertonDetail
     combined_decision: str
 
+    @field_serializer('z_score')
+    def serialize_z_score(self, z_score: float) -> float:
+        return round(z_score, 4)
+
 
 class ErrorResponse(BaseModel):
     """Schema for error responses from the Z-Score API endpoint."""
     ticker: str
-    error: str
\ No newline at end of file
+    error: str
+
+
+class BatchResponse(BaseModel):
+    """Schema for the response body of the batch Z-Score API endpoint."""
+    results: list[ZScoreResponse | ErrorResponse]
@@ -1,13 +1,56 @@
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+
+import numpy as np
+import orjson
 import streamlit as st
 import requests
 import pandas as pd
 import plotly.graph_objects as go
+from joblib import Memory
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from visualization import build_spider_chart
+from visualization import RATIO_KEYS, build_spider_chart
 
 # Configuration
 
 API_URL = "http://localhost:8000/evaluate"
+BATCH_API_URL = "http://localhost:8000/evaluate_batch"
+
+MAX_WORKERS = 16
+
+# Companies per /evaluate_batch call (the backend's MAX_BATCH_SIZE)
+BATCH_SIZE = 50
+
+# (connect, read) timeouts in seconds; a batch waits on several Yahoo fetches
+API_TIMEOUT = (5, 15)
+BATCH_API_TIMEOUT = (5, 60)
+
+# A ticker or industry type in the comma-separated sidebar inputs
+INPUT_TOKEN = re.compile(r"[^,\s]+")
+
+# Shared across worker threads so TCP connections to the backend are reused.
+# Transient gateway errors are retried in-band; evaluations are idempotent,
+# so POST is retried too. Read timeouts are not retried: the backend is
+# still working on the abandoned request, and a retry would only multiply
+# the wait.
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=MAX_WORKERS,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
 
 INDUSTRY_OPTIONS = {
     'Public Manufacturing (Classic Altman Z-Score)': 1,
@@ -41,14 +84,50 @@ DECISION_BG = {
     "Dismissed":             "rgba(232,69,69,0.12)",
 }
 
-RATIO_LABELS = {
-    'x1': 'Working Capital / Total Assets',
-    'x2': 'Retained Earnings / Total Assets',
-    'x3': 'Earnings Before Interest and Taxes / Total Assets',
-    'x4': 'Market Value of Equity / Book Value of Total Liabilities',
-    'x5': 'Sales / Total Assets'
-}
+# (foreground, background) per label, so each card needs one lookup per label
+CLASSIFICATION_STYLE = {k: (CLASSIFICATION_COLORS[k], CLASSIFICATION_BG[k]) for k in CLASSIFICATION_COLORS}
+DECISION_STYLE       = {k: (DECISION_COLORS[k], DECISION_BG[k]) for k in DECISION_COLORS}
+
+# Company card markup, filled once per company with str.format_map
+CARD_TEMPLATE = (
+    '<div class="metric-card">'
+
+    # Ticker + model name
+    '<div class="metric-ticker">{ticker}</div>'
+
+    '<hr class="divider">'
+
+    # Altman section
+    '<div class="metric-label">Altman Z-Score</div>'
+    '<div class="metric-score" style="color:{altman_color};">{z_score}</div>'
+    '<span class="badge" style="color:{altman_color};background:{altman_bg};">'
+    '{classification}</span>'
+
+    '<hr class="divider">'
+
+    # Default distance section
+    '<div class="metric-label">Merton Distance to Default</div>'
+    '<div class="metric-score-sm" style="color:{merton_color};">{dist_to_def}</div>'
+    '<span class="badge" style="color:{merton_color};background:{merton_bg};">'
+    '{merton_cls}</span>'
+
+    '<hr class="divider">'
 
+    # Default probability section
+    '<div class="metric-label">Merton Default Probability</div>'
+    '<div class="metric-score-sm" style="color:{merton_color};">{prob_pct}</div>'
+    '<span class="badge" style="color:{merton_color};background:{merton_bg};">'
+    '{merton_cls}</span>'
+
+    '<hr class="divider">'
+
+    # Combined decision
+    '<div class="metric-label">Credit Decision</div>'
+    '<span class="decision-badge" style="color:{dec_color};background:{dec_bg};">'
+    '{decision}</span>'
+
+    '</div>'
+)
 
 # Set up the Streamlit app
 st.set_page_config(
@@ -58,7 +137,11 @@ st.set_page_config(
 )
 
 
-st.markdown("""
+# Static HTML is built once per process and reused on every rerun
+@st.cache_resource
+def css_block() -> str:
+    """Return the dashboard stylesheet as a <style> block."""
+    return """
 <style>
     /* Base */
     html, body, [class*="css"] {
@@ -94,6 +177,11 @@ st.markdown("""
         margin-bottom: 2.5rem;
     }
 
+    .card-grid {
+        display: grid;
+        gap: 1rem;
+    }
+
     .metric-card {
         background: #161A23;
         border: 1px solid #252A36;
@@ -262,22 +350,165 @@ st.markdown("""
         border-radius: 10px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def sidebar_legend() -> str:
+    """Return the static thresholds, decision and ratio legend for the sidebar."""
+    return (
+        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;">'
+        '<b style="color:#6B7280;">Altman Z-Score (type 1)</b><br>'
+        '<span style="color:#00C896;">■</span> Z > 2.99 — Safe Zone<br>'
+        '<span style="color:#F5A623;">■</span> 1.81 ≤ Z ≤ 2.99 — Grey Zone<br>'
+        '<span style="color:#E84545;">■</span> Z < 1.81 — Distress Zone'
+        '</div>'
+        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;margin-top:0.6rem;">'
+        '<b style="color:#6B7280;">Z\'- / Z\'\'- Score (type 2 & 3)</b><br>'
+        '<span style="color:#00C896;">■</span> Z > 2.6 — Safe Zone<br>'
+        '<span style="color:#F5A623;">■</span> 1.1 ≤ Z ≤ 2.6 — Grey Zone<br>'
+        '<span style="color:#E84545;">■</span> Z < 1.1 — Distress Zone'
+        '</div>'
+        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;margin-top:0.8rem;">'
+        '<b style="color:#6B7280;">Merton Thresholds</b><br>'
+        '<span style="color:#00C896;">■</span> PD < 1% — Safe Zone<br>'
+        '<span style="color:#F5A623;">■</span> 1% ≤ PD < 15% — Grey Zone<br>'
+        '<span style="color:#E84545;">■</span> PD ≥ 15% — Distress Zone'
+        '</div>'
+        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;margin-top:0.8rem;">'
+        '<b style="color:#6B7280;">Credit Decision</b><br>'
+        '<span style="color:#00C896;">■</span> Both Safe → Approved<br>'
+        '<span style="color:#6494ED;">■</span> One Safe → Approved with Caution<br>'
+        '<span style="color:#F5A623;">■</span> Both Grey → Analysis Required<br>'
+        '<span style="color:#E84545;">■</span> Any Distress → Dismissed'
+        '</div>'
+        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;margin-top:0.8rem;">'
+        '<b style="color:#6B7280;">Finantial Ratios</b><br>'
+        'x1: Working Capital / Total Assets<br>'
+        'x2: Retained Earnings / Total Assets<br>'
+        'x3: EBIT / Total Assets<br>'
+        'x4: Market Value of Equity / Book Value of Total Liabilities<br>'
+        'x5: Sales / Total Assets'
+        '</div>'
+    )
+
+
+st.markdown(css_block(), unsafe_allow_html=True)
 
 
 # ----------------------------------------------------------------------
 # Helper functions
 # ----------------------------------------------------------------------
 
-def call_api(ticker: str, industry_type: int) -> dict:
-    """POST to the FastAPI backend and return the JSON response."""
-    response = requests.post(
+# Evaluations are deterministic for a given day, so responses are cached in
+# memory (st.cache_data) on top of an on-disk layer (joblib) that survives
+# restarts. The date argument makes on-disk entries expire daily; entries
+# from earlier days are pruned at startup. Failed calls raise and are
+# therefore never cached by either layer.
+API_MEMORY = Memory(".cache/api", verbose=0)
+
+
+@st.cache_resource
+def prune_api_cache() -> None:
+    """Drop stale on-disk API responses and cap the store, once per process."""
+    API_MEMORY.reduce_size(bytes_limit="100M", age_limit=timedelta(days=1))
+
+
+prune_api_cache()
+
+
+@API_MEMORY.cache
+def _post_evaluate(ticker: str, industry_type: int, day: str) -> dict:
+    response = SESSION.post(
         API_URL,
         json={"ticker": ticker, "industry_type": industry_type},
-        timeout=30,
+        timeout=API_TIMEOUT,
     )
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
+
+
+@API_MEMORY.cache
+def _post_evaluate_batch(tickers: list[str], industry_types: list[int], day: str) -> list[dict]:
+    response = SESSION.post(
+        BATCH_API_URL,
+        json=[
+            {"ticker": ticker, "industry_type": industry_type}
+            for ticker, industry_type in zip(tickers, industry_types)
+        ],
+        timeout=BATCH_API_TIMEOUT,
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)["results"]
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=512)
+def call_api(ticker: str, industry_type: int) -> dict:
+    """POST to the FastAPI backend and return the JSON response."""
+    return _post_evaluate(ticker, industry_type, date.today().isoformat())
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=512)
+def call_api_batch(tickers: list[str], industry_types: list[int]) -> list[dict]:
+    """POST all tickers to the batch endpoint and return one result per ticker."""
+    return _post_evaluate_batch(tickers, industry_types, date.today().isoformat())
+
+
+def forget_batch(tickers: list[str], industry_types: list[int]) -> None:
+    """Evict a batch response from both the in-memory and on-disk caches."""
+    call_api_batch.clear(tickers, industry_types)
+    day = date.today().isoformat()
+    # call_and_shelve would POST again for a batch that is not on disk
+    if _post_evaluate_batch.check_call_in_cache(tickers, industry_types, day):
+        _post_evaluate_batch.call_and_shelve(tickers, industry_types, day).clear()
+
+
+def fmt_number(value: float | None, spec: str) -> str:
+    """Format a numeric API field, or "N/A" when the backend sent null."""
+    return "N/A" if value is None else format(value, spec)
+
+
+def error_detail(exc: Exception) -> str:
+    """Return the backend's error detail for a failed request, if any."""
+    if isinstance(exc, requests.HTTPError):
+        try:
+            return orjson.loads(exc.response.content).get("detail", str(exc))
+        except Exception:
+            pass
+    return str(exc)
+
+
+def evaluate_individually(tickers: list[str], industry_types: list[int], progress) -> list[dict]:
+    """
+    Call the single-ticker endpoint concurrently for each ticker and return
+    one result or {"ticker", "error"} entry per ticker in input order,
+    updating the progress bar as calls complete.
+
+    A thread pool is used rather than an async HTTP client so that every call
+    still goes through the cached call_api; the calls are I/O-bound and the
+    pooled SESSION already reuses connections to the backend.
+    """
+    items = [None] * len(tickers)
+
+    # At most ~20 progress updates regardless of how many tickers are fetched
+    step = max(1, len(tickers) // 20)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(tickers))) as executor:
+        futures = {
+            executor.submit(call_api, ticker, industry_type): i
+            for i, (ticker, industry_type) in enumerate(zip(tickers, industry_types))
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                items[i] = future.result()
+            except Exception as exc:
+                items[i] = {"ticker": tickers[i], "error": error_detail(exc)}
+
+            if done % step == 0 or done == len(tickers):
+                progress.progress(done / len(tickers), text=f"Processing {tickers[i]}...")
+
+    return items
 
 
 
@@ -317,61 +548,25 @@ with st.sidebar:
 
     st.markdown("")
     run = st.button("Run Analysis")
+    if st.button("Clear cache"):
+        st.cache_data.clear()
+        API_MEMORY.clear(warn=False)
 
     st.markdown("---")
-    st.markdown(
-        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;">'
-        '<b style="color:#6B7280;">Altman Z-Score (type 1)</b><br>'
-        '<span style="color:#00C896;">■</span> Z > 2.99 — Safe Zone<br>'
-        '<span style="color:#F5A623;">■</span> 1.81 ≤ Z ≤ 2.99 — Grey Zone<br>'
-        '<span style="color:#E84545;">■</span> Z < 1.81 — Distress Zone'
-        '</div>'
-        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;margin-top:0.6rem;">'
-        '<b style="color:#6B7280;">Z\'- / Z\'\'- Score (type 2 & 3)</b><br>'
-        '<span style="color:#00C896;">■</span> Z > 2.6 — Safe Zone<br>'
-        '<span style="color:#F5A623;">■</span> 1.1 ≤ Z ≤ 2.6 — Grey Zone<br>'
-        '<span style="color:#E84545;">■</span> Z < 1.1 — Distress Zone'
-        '</div>',
-        unsafe_allow_html=True,
-    )
-    st.markdown(
-        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;margin-top:0.8rem;">'
-        '<b style="color:#6B7280;">Merton Thresholds</b><br>'
-        '<span style="color:#00C896;">■</span> PD < 1% — Safe Zone<br>'
-        '<span style="color:#F5A623;">■</span> 1% ≤ PD < 15% — Grey Zone<br>'
-        '<span style="color:#E84545;">■</span> PD ≥ 15% — Distress Zone'
-        '</div>',
-        unsafe_allow_html=True,
-    )
-    st.markdown(
-        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;margin-top:0.8rem;">'
-        '<b style="color:#6B7280;">Credit Decision</b><br>'
-        '<span style="color:#00C896;">■</span> Both Safe → Approved<br>'
-        '<span style="color:#6494ED;">■</span> One Safe → Approved with Caution<br>'
-        '<span style="color:#F5A623;">■</span> Both Grey → Analysis Required<br>'
-        '<span style="color:#E84545;">■</span> Any Distress → Dismissed'
-        '</div>',
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
-        '<div style="font-size:0.72rem;color:#4B5563;line-height:1.6;margin-top:0.8rem;">'
-        '<b style="color:#6B7280;">Finantial Ratios</b><br>'
-        'x1: Working Capital / Total Assets<br>'
-        'x2: Retained Earnings / Total Assets<br>'
-        'x3: EBIT / Total Assets<br>'
-        'x4: Market Value of Equity / Book Value of Total Liabilities<br>'
-        'x5: Sales / Total Assets'
-        '</div>',
-        unsafe_allow_html=True,
-    )
+    st.markdown(sidebar_legend(), unsafe_allow_html=True)
 
 
 # ----------------------------------------------------------------------
 # Main area
 # ----------------------------------------------------------------------
 
-if not run:
+# Keep the inputs of the last "Run Analysis" click (and, further down, the
+# results fetched for them) so that reruns triggered by other widgets (e.g.
+# the ratio breakdown toggles) redraw the same results without refetching
+if run:
+    st.session_state["submitted"] = (tickers_raw, industry_raw)
+
+if "submitted" not in st.session_state:
     st.markdown(
         '<div style="display:flex;align-items:center;justify-content:center;'
         'height:60vh;flex-direction:column;gap:1rem;">'
@@ -383,15 +578,17 @@ if not run:
     )
     st.stop()
 
-# Parse tickers
-tickers = [t.strip().upper() for t in tickers_raw.split(",") if t.strip()]
-industry_types_raw = [i.strip() for i in industry_raw.split(",") if i.strip()]
+tickers_raw, industry_raw = st.session_state["submitted"]
+
+# Parse tickers: one regex pass per input, separators are commas/whitespace
+tickers = [t.upper() for t in INPUT_TOKEN.findall(tickers_raw)]
+industry_types_raw = np.array(INPUT_TOKEN.findall(industry_raw))
 
 if not tickers:
     st.warning("Please enter at least one ticker symbol.")
     st.stop()
 
-if not industry_types_raw:
+if not industry_types_raw.size:
     st.warning("Please enter at least one industry type.")
     st.stop()
 
@@ -404,41 +601,68 @@ if len(industry_types_raw) != len(tickers):
     st.stop()
 
 try:
-    industry_types = [int(v) for v in industry_types_raw]
-except ValueError:
+    industry_array = industry_types_raw.astype(np.int64)
+except (ValueError, OverflowError):
     st.error("Industry types must be integers: 1, 2, or 3.")
     st.stop()
 
-invalid = [v for v in industry_types if v not in (1, 2, 3)]
-if invalid:
-    st.error(f"Invalid industry type(s): {invalid}. Must be 1, 2, or 3.")
+invalid_mask = ~np.isin(industry_array, (1, 2, 3))
+if invalid_mask.any():
+    st.error(f"Invalid industry type(s): {industry_array[invalid_mask].tolist()}. Must be 1, 2, or 3.")
     st.stop()
 
+industry_types = industry_array.tolist()
+
 # ----------------------------------------------------------------------
 # API calls with progress feedback
 # ----------------------------------------------------------------------
 
-results = []
-errors  = []
-
-progress = st.progress(0, text="Fetching financial data...")
-
-for i, (ticker, industry_type) in enumerate(zip(tickers, industry_types)):
-    try:
-        data = call_api(ticker, industry_type)
-        results.append(data)
-    except requests.HTTPError as exc:
+# Each distinct (ticker, industry type) pair is requested once and its
+# result is mapped back to every position it was entered at
+pairs          = list(zip(tickers, industry_types))
+unique_pairs   = list(dict.fromkeys(pairs))
+unique_tickers = [ticker for ticker, _ in unique_pairs]
+unique_types   = [industry_type for _, industry_type in unique_pairs]
+
+# Only a "Run Analysis" click fetches; other reruns reuse the stored items.
+# They are kept with the pairs they were fetched for, so a fetch interrupted
+# by a widget rerun is redone rather than matched to the wrong inputs.
+fetched = st.session_state.get("items")
+if run or fetched is None or fetched[0] != unique_pairs:
+    progress = st.progress(0, text="Fetching financial data...")
+
+    # One round-trip per BATCH_SIZE companies; per-ticker failures come back as
+    # {"ticker", "error"} entries alongside the successful results.
+    items = []
+    for start in range(0, len(unique_pairs), BATCH_SIZE):
+        batch_tickers = unique_tickers[start:start + BATCH_SIZE]
+        batch_types   = unique_types[start:start + BATCH_SIZE]
         try:
-            detail = exc.response.json().get("detail", str(exc))
-        except Exception:
-            detail = str(exc)
-        errors.append({"ticker": ticker, "error": detail})
-    except Exception as exc:
-        errors.append({"ticker": ticker, "error": str(exc)})
-
-    progress.progress((i + 1) / len(tickers), text=f"Processing {ticker}...")
-
-progress.empty()
+            batch_items = call_api_batch(batch_tickers, batch_types)
+            if any("error" in item for item in batch_items):
+                # Do not keep partial failures cached; they may be transient
+                forget_batch(batch_tickers, batch_types)
+        except requests.HTTPError as exc:
+            if exc.response is not None and exc.response.status_code == 404:
+                # Backend without the batch endpoint
+                batch_items = evaluate_individually(batch_tickers, batch_types, progress)
+            else:
+                batch_items = [{"ticker": ticker, "error": error_detail(exc)} for ticker in batch_tickers]
+        except Exception as exc:
+            batch_items = [{"ticker": ticker, "error": str(exc)} for ticker in batch_tickers]
+
+        items.extend(batch_items)
+        progress.progress(len(items) / len(unique_pairs), text="Fetching financial data...")
+
+    progress.empty()
+    fetched = st.session_state["items"] = (unique_pairs, items)
+
+items = fetched[1]
+
+items_by_pair = dict(zip(unique_pairs, items))
+items   = [items_by_pair[pair] for pair in pairs]
+results = [item for item in items if "error" not in item]
+errors  = [item for item in items if "error" in item]
 
 # ----------------------------------------------------------------------
 # Error display
@@ -465,73 +689,60 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-cols = st.columns(min(len(results), 3))
-
-for idx, r in enumerate(results):
-    col = cols[idx % len(cols)]
-
-    altman_color = CLASSIFICATION_COLORS[r["classification"]]
-    altman_bg    = CLASSIFICATION_BG[r["classification"]]
-
-    merton       = r["merton"]
-    merton_color = CLASSIFICATION_COLORS[merton["classification"]]
-    merton_bg    = CLASSIFICATION_BG[merton["classification"]]
-    dist_to_def   = merton["distance_to_default"]
-    prob_pct     = merton["default_probability"] * 100
-
-    decision     = r["combined_decision"]
-    dec_color    = DECISION_COLORS[decision]
-    dec_bg       = DECISION_BG[decision]
-
-    ratios = r["ratios"]
-
-    with col:
-        st.markdown(
-            f'<div class="metric-card">'
-
-            # Ticker + model name
-            f'<div class="metric-ticker">{r["ticker"]}</div>'
-
-            f'<hr class="divider">'
-
-            # Altman section
-            f'<div class="metric-label">Altman Z-Score</div>'
-            f'<div class="metric-score" style="color:{altman_color};">{r["z_score"]:.2f}</div>'
-            f'<span class="badge" style="color:{altman_color};background:{altman_bg};">'
-            f'{r["classification"]}</span>'
-
-            f'<hr class="divider">'
-
-            # Default distance section
-            f'<div class="metric-label">Merton Distance to Default</div>'
-            f'<div class="metric-score-sm" style="color:{merton_color};">{dist_to_def:.4f}</div>'
-            f'<span class="badge" style="color:{merton_color};background:{merton_bg};">'
-            f'{merton["classification"]}</span>'
-
-            f'<hr class="divider">'
-
-            # Default probability section
-            f'<div class="metric-label">Merton Default Probability</div>'
-            f'<div class="metric-score-sm" style="color:{merton_color};">{prob_pct:.2f}%</div>'
-            f'<span class="badge" style="color:{merton_color};background:{merton_bg};">'
-            f'{merton["classification"]}</span>'
-
-            f'<hr class="divider">'
-
-            # Combined decision
-            f'<div class="metric-label">Credit Decision</div>'
-            f'<span class="decision-badge" style="color:{dec_color};background:{dec_bg};">'
-            f'{decision}</span>'
+# Cards are laid out by a CSS grid with as many columns as there are
+# results, up to three
+n_cols    = min(len(results), 3)
+card_html = []
+
+for r in results:
+    merton = r["merton"]
+
+    altman_color, altman_bg = CLASSIFICATION_STYLE[r["classification"]]
+    merton_color, merton_bg = CLASSIFICATION_STYLE[merton["classification"]]
+    dec_color, dec_bg       = DECISION_STYLE[r["combined_decision"]]
+
+    # Scores the backend could not compute (NaN) arrive as null, shown as N/A
+    card_html.append(CARD_TEMPLATE.format_map({
+        "ticker":         r["ticker"],
+        "z_score":        fmt_number(r["z_score"], ".2f"),
+        "classification": r["classification"],
+        "altman_color":   altman_color,
+        "altman_bg":      altman_bg,
+        "dist_to_def":    fmt_number(merton["distance_to_default"], ".4f"),
+        "prob_pct":       fmt_number(merton["default_probability"], ".2%"),
+        "merton_cls":     merton["classification"],
+        "merton_color":   merton_color,
+        "merton_bg":      merton_bg,
+        "decision":       r["combined_decision"],
+        "dec_color":      dec_color,
+        "dec_bg":         dec_bg,
+    }))
+
+# Ratio breakdowns need real Streamlit widgets, so each row of cards is
+# emitted in one markdown call followed by that row's st.columns, keeping
+# every breakdown directly under its card
+for row_start in range(0, len(results), n_cols):
+    st.markdown(
+        f'<div class="card-grid" style="grid-template-columns:repeat({n_cols}, 1fr);">'
+        f'{"".join(card_html[row_start:row_start + n_cols])}</div>',
+        unsafe_allow_html=True,
+    )
+    cols = st.columns(n_cols)
 
-            f'</div>',
-            unsafe_allow_html=True,
-        )
+    for j, r in enumerate(results[row_start:row_start + n_cols]):
+        ratios    = tuple(r["ratios"].get(k) or 0.0 for k in RATIO_KEYS)
+        dec_color = DECISION_COLORS[r["combined_decision"]]
 
-        with st.expander("Ratio breakdown"):
-            st.plotly_chart(
-                build_spider_chart(ratios, r["ticker"], dec_color, RATIO_LABELS),
-                width='stretch',
-            )
+        with cols[j]:
+            # The figure is only built once the user asks for it
+            if st.checkbox(
+                f"Show ratio breakdown — {r['ticker']}",
+                key=f"ratios_{row_start + j}_{r['ticker']}",
+            ):
+                st.plotly_chart(
+                    build_spider_chart(ratios, r["ticker"], dec_color),
+                    width='stretch',
+                )
 
 
 # ----------------------------------------------------------------------
@@ -543,19 +754,26 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-table_data = [
-    {
-        "Ticker":              r["ticker"],
-        "Model":               r["model_name"],
-        "Z-Score":             f'{r["z_score"]:.4f}',
-        "Altman Zone":         r["classification"],
-        "Distance to Default": f'{r["merton"]["distance_to_default"]:.4f}',
-        "Default Prob (%)":    f'{r["merton"]["default_probability"] * 100:.2f}%',
-        "Merton Zone":         r["merton"]["classification"],
-        "Decision":            r["combined_decision"],
-    }
-    for r in results
-]
-
-df = pd.DataFrame(table_data)
+# Column-wise construction; nulls become NaN and each numeric column is
+# formatted in one pass. Z-Score and distance to default are unbounded, so
+# they stay float64 (float32 would lose 4-decimal precision above ~2048);
+# only the [0, 1] default probability is narrowed to float32.
+df = pd.DataFrame({
+    "Ticker":      [r["ticker"] for r in results],
+    "Model":       [r["model_name"] for r in results],
+    "z":           np.asarray([r["z_score"] for r in results], dtype=np.float64),
+    "Altman Zone": [r["classification"] for r in results],
+    "dd":          np.asarray([r["merton"]["distance_to_default"] for r in results], dtype=np.float64),
+    "pd":          np.asarray([r["merton"]["default_probability"] for r in results], dtype=np.float32),
+    "Merton Zone": [r["merton"]["classification"] for r in results],
+    "Decision":    [r["combined_decision"] for r in results],
+})
+df["Z-Score"]             = df["z"].map("{:.4f}".format).where(df["z"].notna(), "N/A")
+df["Distance to Default"] = df["dd"].map("{:.4f}".format).where(df["dd"].notna(), "N/A")
+df["Default Prob (%)"]    = (df["pd"] * 100).map("{:.2f}%".format).where(df["pd"].notna(), "N/A")
+
+df = df[[
+    "Ticker", "Model", "Z-Score", "Altman Zone",
+    "Distance to Default", "Default Prob (%)", "Merton Zone", "Decision",
+]]
 st.dataframe(df, width='stretch', hide_index=True)
\ No newline at end of file
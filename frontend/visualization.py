@@ -1,29 +1,66 @@
+import math
+
+import numpy as np
 import plotly.graph_objects as go
+import streamlit as st
+
+RATIO_KEYS = ('x1', 'x2', 'x3', 'x4', 'x5')
+
+RATIO_LABELS = {
+    'x1': 'Working Capital / Total Assets',
+    'x2': 'Retained Earnings / Total Assets',
+    'x3': 'Earnings Before Interest and Taxes / Total Assets',
+    'x4': 'Market Value of Equity / Book Value of Total Liabilities',
+    'x5': 'Sales / Total Assets'
+}
+
+# Angular labels of the closed polygon (first ratio repeated at the end)
+_THETA = RATIO_KEYS + RATIO_KEYS[:1]
+
+
+def _fill_color(color: str) -> str:
+    """Return a low-opacity rgba fill derived from a hex colour."""
+    return f"rgba({int(color[1:3], 16)},{int(color[3:5], 16)},{int(color[5:7], 16)},0.25)"
+
+
+# Fills for the dashboard's closed palette of decision/classification colours
+_FILL = {c: _fill_color(c) for c in ("#E84545", "#00C896", "#F5A623", "#6494ED")}
+
+
+def build_spider_chart(ratios_tuple: tuple, ticker: str, color: str) -> go.Figure:
+    """
+    Build a radar/spider chart for a single company's Altman ratios, given
+    as a tuple ordered like RATIO_KEYS. Figures are cached across reruns
+    unless a ratio is NaN.
+    """
+    if any(math.isnan(v) for v in ratios_tuple):
+        return _build_spider_chart(ratios_tuple, ticker, color)
+    return _cached_spider_chart(ratios_tuple, ticker, color)
+
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _cached_spider_chart(ratios_tuple: tuple, ticker: str, color: str) -> go.Figure:
+    return _build_spider_chart(ratios_tuple, ticker, color)
 
-def build_spider_chart(ratios: dict, ticker: str, color: str, ratio_labels: dict) -> go.Figure:
-    """Build a radar/spider chart for a single company's Altman ratios."""
-    keys   = ['x1', 'x2', 'x3', 'x4', 'x5']
-    labels = ['x1', 'x2', 'x3', 'x4', 'x5']
-    values = [ratios.get(k) or 0.0 for k in keys]
 
-    # Close the polygon
-    r      = values + [values[0]]
-    theta  = labels + [labels[0]]
+def _build_spider_chart(ratios_tuple: tuple, ticker: str, color: str) -> go.Figure:
+    # Close the polygon. The radii are sent to the browser as a compact
+    # float32 typed array; hover text keeps the full-precision values.
+    values = np.fromiter(ratios_tuple, dtype=np.float64, count=len(RATIO_KEYS))
+    closed = np.concatenate([values, values[:1]])
+    r      = closed.astype(np.float32)
     hover  = [
-        f"<b>{lbl}</b><br>{ratio_labels[k]}<br>Value: {v:.4f}<extra></extra>"
-        for lbl, k, v in zip(labels, keys, values)
-    ] + [f"<b>{labels[0]}</b><br>{ratio_labels[keys[0]]}<br>Value: {values[0]:.4f}<extra></extra>"]
+        f"<b>{k}</b><br>{RATIO_LABELS[k]}<br>Value: {v:.4f}<extra></extra>"
+        for k, v in zip(_THETA, closed)
+    ]
 
     # Low-opacity fill derived from the classification colour (hex → rgba)
-    r_ch = int(color[1:3], 16)
-    g_ch = int(color[3:5], 16)
-    b_ch = int(color[5:7], 16)
-    fill_color = f"rgba({r_ch},{g_ch},{b_ch},0.25)"
+    fill_color = _FILL.get(color) or _fill_color(color)
 
     fig = go.Figure()
     fig.add_trace(go.Scatterpolar(
         r=r,
-        theta=theta,
+        theta=_THETA,
         fill='toself',
         fillcolor=fill_color,
         line=dict(color=color, width=2),